@@ -67,13 +67,61 @@ def create_cdn_url(path: str, extension: str, size: int = None, valid_exts: typi
 
     return ret
 
-def get_optional_snowflake(data: typing.Dict[str, typing.Any], key: str) -> typing.Optional[int]:
-    r"""Helper to obtain optional or nullable snowflakes from a raw payload."""
+def to_optional_snowflake(value: typing.Any) -> typing.Optional[int]:
+    r"""Converts an optional or nullable snowflake value to an integer."""
+    # Missing and null values are the common case here, avoid raising
+    # and catching an exception for them.
+    if value is None:
+        return None
+
     try:
-        return int(data[key])
-    except (KeyError, ValueError, TypeError):
+        return int(value)
+    except (ValueError, TypeError):
         return None
 
+def get_optional_snowflake(data: typing.Dict[str, typing.Any], key: str) -> typing.Optional[int]:
+    r"""Helper to obtain optional or nullable snowflakes from a raw payload."""
+    return to_optional_snowflake(data.get(key))
+
+def to_int(value: typing.Any) -> int:
+    r"""Converts the value to an integer, returning it as-is if it's already an integer."""
+    return value if type(value) is int else int(value)
+
+def create_json_builder(
+    fields: typing.Sequence[typing.Tuple[str, str, typing.Optional[typing.Callable[[typing.Any], typing.Any]]]],
+) -> typing.Callable[[typing.Dict[str, typing.Any]], typing.Dict[str, typing.Any]]:
+    r"""Creates a function that builds a JSON payload from the provided fields.
+
+    The fields are (parameter name, JSON key, transformer) tuples. The created
+    function takes a mapping of parameters (usually the ``locals()`` of an
+    ``edit()`` method) and includes the parameters that are not :data:`UNDEFINED`.
+    The generated code is equivalent to writing ``if param is not UNDEFINED``
+    checks by hand for each field.
+    """
+    namespace: typing.Dict[str, typing.Any] = {"UNDEFINED": UNDEFINED}
+    # UNDEFINED and the transformers are bound as default arguments so
+    # the generated code accesses them as locals instead of globals.
+    params = ["options", "_undefined=UNDEFINED"]
+    lines = ["    json = {}"]
+
+    for index, (param, key, transformer) in enumerate(fields):
+        value = "value"
+
+        if transformer is not None:
+            name = f"_transformer_{index}"
+            namespace[name] = transformer
+            params.append(f"{name}={name}")
+            value = f"{name}(value)"
+
+        lines.append(f"    value = options[{param!r}]")
+        lines.append("    if value is not _undefined:")
+        lines.append(f"        json[{key!r}] = {value}")
+
+    lines.insert(0, f"def build({', '.join(params)}):")
+    lines.append("    return json")
+    exec("\n".join(lines), namespace)
+    return namespace["build"]
+
 def compute_shard_id(guild_id: int, shards_count: int) -> int:
     r"""Computes shard ID for the provided guild ID with respect to given shards count."""
     return (guild_id >> 22) % shards_count
@@ -94,6 +142,22 @@ def get_image_data(img_bytes: bytes) -> str:
 
     return f"data:{content_type};base64,{b64encode(img_bytes).decode('ascii')}"
 
+try:
+    # Optional dependency, installed with the "fast" extra.
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = None
+
+_fromisoformat = datetime.fromisoformat
+
 def parse_iso_timestamp(timestamp: str) -> datetime:
     r"""Parse ISO timestamp string to a datetime.datetime instance."""
-    return datetime.fromisoformat(timestamp)
\ No newline at end of file
+    if _parse_datetime is not None:
+        return _parse_datetime(timestamp)
+
+    # datetime.fromisoformat() does not support the "Z" suffix
+    # for UTC prior to Python 3.11.
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+
+    return _fromisoformat(timestamp)
@@ -38,6 +38,8 @@ class MessagesSupported(ABC):
     Almost all classes that support the :class:`Message` related operations
     inherit this class. The most common example is :class:`TextChannel`.
     """
+    __slots__ = ()
+
     _rest: RestClient
 
     @abstractmethod
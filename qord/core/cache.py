@@ -465,3 +465,12 @@ class GuildCache(ABC):
             The deleted channel if any. If no channel existed with provided ID,
             ``None`` is returned.
         """
+
+    def _get_children_channels(self, parent_id: int) -> typing.List[GuildChannel]:
+        # Implementations that index channels by their parent (such as the
+        # DefaultGuildCache) should override this to avoid the full scan.
+        return [channel for channel in self.channels() if channel.parent_id == parent_id]
+
+    def _update_channel_position(self, channel: GuildChannel, old_parent_id: typing.Optional[int]) -> None:
+        # Called when the parent_id or position of a channel is updated in place.
+        pass
@@ -157,6 +157,8 @@ class DefaultGuildCache(GuildCache):
         self._roles: typing.Dict[int, Role] = {}
         self._members: typing.Dict[int, GuildMember] = {}
         self._channels: typing.Dict[int, GuildChannel] = {}
+        self._children_by_parent: typing.Dict[int, typing.Dict[int, GuildChannel]] = {}
+        self._sorted_children: typing.Dict[int, typing.List[GuildChannel]] = {}
 
     def roles(self) -> typing.Sequence[Role]:
         roles = list(self._roles.values())
@@ -221,10 +223,77 @@ class DefaultGuildCache(GuildCache):
         if not isinstance(channel, GuildChannel):
             raise TypeError("Parameter channel must be an instance of GuildChannel.")
 
+        existing = self._channels.get(channel.id)
+
+        if existing is not None:
+            self._remove_child(existing, existing.parent_id)
+
         self._channels[channel.id] = channel
+        self._add_child(channel, channel.parent_id)
 
     def delete_channel(self, channel_id: int) -> typing.Optional[GuildChannel]:
         if not isinstance(channel_id, int):
             raise TypeError("Parameter channel_id must be an integer.")
 
-        return self._channels.pop(channel_id, None)
+        channel = self._channels.pop(channel_id, None)
+
+        if channel is not None:
+            self._remove_child(channel, channel.parent_id)
+
+        return channel
+
+    def _add_child(self, channel: GuildChannel, parent_id: typing.Optional[int]) -> None:
+        if parent_id is None:
+            return
+
+        children = self._children_by_parent.get(parent_id)
+
+        if children is None:
+            children = self._children_by_parent[parent_id] = {}
+
+        children[channel.id] = channel
+        self._sorted_children.pop(parent_id, None)
+
+    def _remove_child(self, channel: GuildChannel, parent_id: typing.Optional[int]) -> None:
+        if parent_id is None:
+            return
+
+        children = self._children_by_parent.get(parent_id)
+
+        if children is not None:
+            children.pop(channel.id, None)
+
+            if not children:
+                del self._children_by_parent[parent_id]
+
+        self._sorted_children.pop(parent_id, None)
+
+    def _get_children_channels(self, parent_id: int) -> typing.List[GuildChannel]:
+        ret = self._sorted_children.get(parent_id)
+
+        if ret is None:
+            children = self._children_by_parent.get(parent_id)
+
+            if not children:
+                return []
+
+            ret = list(children.values())
+            ret.sort(key=lambda c: c.position)
+            self._sorted_children[parent_id] = ret
+
+        # Copied so that the memoized list cannot be mutated by the caller.
+        return ret.copy()
+
+    def _update_channel_position(self, channel: GuildChannel, old_parent_id: typing.Optional[int]) -> None:
+        if self._channels.get(channel.id) is not channel:
+            # Not the cached instance e.g a copy or a fetched channel.
+            return
+
+        parent_id = channel.parent_id
+
+        if parent_id == old_parent_id:
+            # Only the position has changed.
+            self._sorted_children.pop(parent_id, None) # type: ignore
+        else:
+            self._remove_child(channel, old_parent_id)
+            self._add_child(channel, parent_id)
@@ -26,17 +26,123 @@ from qord.models.base import BaseModel
 from qord.models.users import User
 from qord.bases import MessagesSupported
 from qord.enums import ChannelType
-from qord._helpers import get_optional_snowflake, parse_iso_timestamp, UNDEFINED
-
+from qord._helpers import (
+    create_json_builder,
+    get_optional_snowflake,
+    parse_iso_timestamp,
+    to_int,
+    to_optional_snowflake,
+    UNDEFINED,
+)
+
+import sys
 import typing
 
 if typing.TYPE_CHECKING:
     from datetime import datetime
     from qord.core.client import Client
+    from qord.core.rest import RestClient
     from qord.models.guilds import Guild
     from qord.models.users import User
 
 
+_TEXT_CHANNEL_EDIT_TYPES = frozenset((ChannelType.NEWS, ChannelType.TEXT))
+_VALID_AUTO_ARCHIVE_DURATIONS = frozenset((60, 1440, 4320, 10080))
+
+def _validate_text_channel_type(type: int) -> int:
+    if type not in _TEXT_CHANNEL_EDIT_TYPES:
+        raise ValueError("type parameter only supports ChannelType.NEWS and TEXT.")
+    return type
+
+def _validate_default_auto_archive_duration(duration: int) -> int:
+    if duration not in _VALID_AUTO_ARCHIVE_DURATIONS:
+        raise ValueError("Invalid value given for default_auto_archive_duration " \
+                        "supported values are 60, 1440, 4320 and 10080.")
+    return duration
+
+def _validate_bitrate(bitrate: int) -> int:
+    if bitrate < 8000 or bitrate > 128000:
+        raise ValueError("Parameter 'bitrate' must be in range of 8000 and 128000")
+    return bitrate
+
+def _zero_if_none(value: typing.Optional[int]) -> int:
+    return 0 if value is None else value
+
+def _parent_to_id(parent: typing.Optional[CategoryChannel]) -> typing.Optional[int]:
+    return parent.id if parent is not None else None
+
+# (parameter name, JSON key, transformer) entries for channels edit() methods.
+_TEXT_CHANNEL_EDIT_FIELDS = (
+    ("name", "name", None),
+    ("type", "type", _validate_text_channel_type),
+    ("position", "position", None),
+    ("nsfw", "nsfw", None),
+    ("topic", "topic", None),
+    ("slowmode_delay", "rate_limit_per_user", _zero_if_none),
+    ("default_auto_archive_duration", "default_auto_archive_duration", _validate_default_auto_archive_duration),
+    ("parent", "parent_id", _parent_to_id),
+)
+
+_CATEGORY_CHANNEL_EDIT_FIELDS = (
+    ("name", "name", None),
+    ("position", "position", None),
+)
+
+_VOICE_CHANNEL_EDIT_FIELDS = (
+    ("name", "name", None),
+    ("position", "position", None),
+    ("rtc_region", "rtc_region", None),
+    ("bitrate", "bitrate", _validate_bitrate),
+    ("user_limit", "user_limit", _zero_if_none),
+    ("video_quality_mode", "video_quality_mode", None),
+    ("parent", "parent_id", _parent_to_id),
+)
+
+_build_text_channel_edit_json = create_json_builder(_TEXT_CHANNEL_EDIT_FIELDS)
+_build_category_channel_edit_json = create_json_builder(_CATEGORY_CHANNEL_EDIT_FIELDS)
+_build_voice_channel_edit_json = create_json_builder(_VOICE_CHANNEL_EDIT_FIELDS)
+
+def _intern_optional(value: typing.Optional[str]) -> typing.Optional[str]:
+    # Only used for values from a small fixed set (e.g. RTC regions). Interned
+    # strings may never be freed so user controlled values are not interned.
+    return sys.intern(value) if value is not None else None
+
+def _make_field_updaters(
+    fields: typing.Sequence[typing.Tuple[str, str, typing.Any, typing.Any]],
+) -> typing.Tuple[typing.Callable[..., None], typing.Callable[..., None]]:
+    # Generates the functions that initialize and update the optional fields
+    # of a channel from a flat list of all fields in the MRO so that no super()
+    # chain is walked on each update. The initializer assigns each field once,
+    # using the default for missing keys, while the updater only assigns the
+    # fields present in the payload.
+    namespace: typing.Dict[str, typing.Any] = {}
+    init_params = ["self", "data"]
+    inits = []
+    updates = ["def update_fields(self, data):"]
+
+    for index, (key, attr, default, transformer) in enumerate(fields):
+        default_name = f"_default_{index}"
+        namespace[default_name] = default
+        init_params.append(f"{default_name}={default_name}")
+
+        value = f"data[{key!r}]"
+
+        if transformer is not None:
+            name = f"_transformer_{index}"
+            namespace[name] = transformer
+            init_params.append(f"{name}={name}")
+            value = f"{name}({value})"
+
+        inits.append(f"    self.{attr} = {value} if {key!r} in data else {default_name}")
+        updates.append(f"    if {key!r} in data:")
+        updates.append(f"        self.{attr} = {value}")
+
+    inits.insert(0, f"def init_fields({', '.join(init_params)}):")
+    exec("\n".join(inits), namespace)
+    exec("\n".join(updates), namespace)
+    return namespace["init_fields"], namespace["update_fields"]
+
+
 class GuildChannel(BaseModel):
     """The base class for channel types that are associated to a specific guild.
 
@@ -65,6 +171,8 @@ class GuildChannel(BaseModel):
         The position of this channel in channels list.
     parent_id: :class:`builtins.int`
         The ID of category that this channel is associated to.
+    mention: :class:`builtins.str`
+        The string used for mentioning the channel in Discord client.
     """
 
     if typing.TYPE_CHECKING:
@@ -75,40 +183,111 @@ class GuildChannel(BaseModel):
         position: int
         nsfw: bool
         parent_id: typing.Optional[int]
+        mention: str
 
     __slots__ = (
-        "_client",
-        "_rest",
         "guild",
         "id",
         "type",
         "name",
         "position",
-        "parent_id"
+        "parent_id",
+        "mention",
     )
 
+    # (JSON key, attribute name, default, transformer) entries for the optional
+    # fields defined by a channel class. Fields are only updated when their key
+    # is present in the payload. Subclasses only declare their own fields, see
+    # __init_subclass__() below.
+    _UPDATE_FIELDS: typing.ClassVar[typing.Tuple[typing.Tuple[str, str, typing.Any, typing.Any], ...]] = ()
+
+    # The slots of all classes in the MRO, used by __copy__().
+    _COPY_SLOTS: typing.ClassVar[typing.Tuple[str, ...]] = __slots__
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        fields = []
+        slots = []
+        for klass in reversed(cls.__mro__):
+            fields.extend(klass.__dict__.get("_UPDATE_FIELDS", ()))
+            slots.extend(klass.__dict__.get("__slots__", ()))
+
+        cls._COPY_SLOTS = tuple(slot for slot in slots if slot != "__weakref__")
+
+        if fields:
+            cls._init_fields, cls._update_fields = _make_field_updaters(fields) # type: ignore
+
     def __init__(self, data: typing.Dict[str, typing.Any], guild: Guild) -> None:
+        # Construction is the hot path (GUILD_CREATE, fetch_channels()) so
+        # the fields are assigned directly here rather than going through
+        # _update_with_data() which tracks changes for the guild's cache.
         self.guild = guild
-        self._client = guild._client
-        self._rest = guild._rest
-        self._update_with_data(data)
+        self.id = channel_id = int(data["id"])
+        self.type = to_int(data["type"])
+        self.name = data["name"]
+
+        try:
+            self.position = data["position"]
+        except KeyError:
+            # Rarely omitted.
+            self.position = 1
+
+        self.parent_id = get_optional_snowflake(data, "parent_id")
+        self.mention = f"<#{channel_id}>"
+        self._init_fields(data)
+
+    def __copy__(self) -> GuildChannel:
+        # Used for the "before" channel in CHANNEL_UPDATE. Assigning slots
+        # directly is considerably faster than the default __reduce_ex__()
+        # based copying.
+        new = object.__new__(self.__class__)
+
+        for slot in self._COPY_SLOTS:
+            try:
+                value = getattr(self, slot)
+            except AttributeError:
+                # Slot not set yet.
+                continue
+            setattr(new, slot, value)
+
+        return new
+
+    def _init_fields(self, data: typing.Dict[str, typing.Any]) -> None:
+        pass
+
+    def _update_fields(self, data: typing.Dict[str, typing.Any]) -> None:
+        pass
 
     def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
+        old_position = self.position
+        old_parent_id = self.parent_id
+
         self.id = int(data["id"])
-        self.type = int(data["type"])
+        self.type = to_int(data["type"])
         self.name = data["name"]
-        self.position = data.get("position", 1)
-        self.parent_id = get_optional_snowflake(data, "parent_id")
+
+        try:
+            self.position = data["position"]
+        except KeyError:
+            # Rarely omitted, keep the previous position.
+            pass
+
+        self.mention = f"<#{self.id}>"
+        self.parent_id = parent_id = get_optional_snowflake(data, "parent_id")
+
+        if old_parent_id != parent_id or old_position != self.position:
+            self.guild.cache._update_channel_position(self, old_parent_id)
+
+        self._update_fields(data)
 
     @property
-    def mention(self) -> str:
-        """The string used for mentioning the channel in Discord client.
+    def _client(self) -> Client:
+        return self.guild._client
 
-        Returns
-        -------
-        :class:`builtins.str`
-        """
-        return f"<#{self.id}>"
+    @property
+    def _rest(self) -> RestClient:
+        return self.guild._rest
 
     async def delete(self, *, reason: str = None) -> None:
         """Deletes this channel.
@@ -128,7 +307,7 @@ class GuildChannel(BaseModel):
         HTTPException
             Failed to perform this action.
         """
-        await self._rest.delete_channel(channel_id=self.id, reason=reason)
+        await self.guild._rest.delete_channel(channel_id=self.id, reason=reason)
 
     async def edit(self, **kwargs) -> None:
         raise NotImplementedError("edit() must be implemented by subclasses.")
@@ -153,14 +332,11 @@ class TextChannel(GuildChannel, MessagesSupported):
     default_auto_archive_duration: :class:`builtins.int`
         The default auto archiving duration (in minutes) of this channel after which
         in active threads associated to this channel are automatically archived.
-    last_pin_timestamp: Optional[:class:`datetime.datetime`]
-        The time when last pin in this channel was created.
     """
 
     if typing.TYPE_CHECKING:
         topic: typing.Optional[str]
         last_message_id: typing.Optional[int]
-        last_pin_timestamp: typing.Optional[datetime]
         slowmode_delay: int
         default_auto_archive_duration: int
 
@@ -170,21 +346,40 @@ class TextChannel(GuildChannel, MessagesSupported):
         "last_message_id",
         "default_auto_archive_duration",
         "nsfw",
-        "last_pin_timestamp",
+        "_last_pin_timestamp_raw",
+        "_last_pin_timestamp",
     )
 
-    def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
-        super()._update_with_data(data)
+    _UPDATE_FIELDS = (
+        ("topic", "topic", None, None),
+        ("last_message_id", "last_message_id", None, to_optional_snowflake),
+        ("rate_limit_per_user", "slowmode_delay", 0, None),
+        ("default_auto_archive_duration", "default_auto_archive_duration", 60, None),
+        ("nsfw", "nsfw", False, None),
+        # Pending raw value, parsed lazily by the last_pin_timestamp property.
+        ("last_pin_timestamp", "_last_pin_timestamp_raw", None, None),
+    )
 
-        self.topic = data.get("topic")
-        self.last_message_id = get_optional_snowflake(data, "last_message_id")
-        self.slowmode_delay = data.get("rate_limit_per_user", 0)
-        self.default_auto_archive_duration = data.get("default_auto_archive_duration", 60)
-        self.nsfw = data.get("nsfw", False)
-        last_pin_timestamp = data.get("last_pin_timestamp")
-        self.last_pin_timestamp = (
-            parse_iso_timestamp(last_pin_timestamp) if last_pin_timestamp is not None else None
-        )
+    @property
+    def last_pin_timestamp(self) -> typing.Optional[datetime]:
+        """The time when last pin in this channel was created.
+
+        Returns
+        -------
+        Optional[:class:`datetime.datetime`]
+        """
+        raw = self._last_pin_timestamp_raw
+
+        if raw is not UNDEFINED:
+            self._last_pin_timestamp = parse_iso_timestamp(raw) if raw is not None else None
+            self._last_pin_timestamp_raw = UNDEFINED
+
+        return self._last_pin_timestamp
+
+    @last_pin_timestamp.setter
+    def last_pin_timestamp(self, value: typing.Optional[datetime]) -> None:
+        self._last_pin_timestamp = value
+        self._last_pin_timestamp_raw = UNDEFINED
 
     async def _get_message_channel(self) -> typing.Any:
         return self
@@ -244,44 +439,10 @@ class TextChannel(GuildChannel, MessagesSupported):
         HTTPException
             Failed to perform this action.
         """
-        json = {}
-
-        if name is not UNDEFINED:
-            json["name"] = name
-
-        if type is not UNDEFINED:
-            if not type in (ChannelType.NEWS, ChannelType.TEXT):
-                raise ValueError("type parameter only supports ChannelType.NEWS and TEXT.")
-
-            json["type"] = type
-
-        if position is not UNDEFINED:
-            json["position"] = position
-
-        if nsfw is not UNDEFINED:
-            json["nsfw"] = nsfw
-
-        if topic is not UNDEFINED:
-            json["topic"] = topic
-
-        if slowmode_delay is not UNDEFINED:
-            if slowmode_delay is None:
-                slowmode_delay = 0
-
-            json["rate_limit_per_user"] = slowmode_delay
-
-        if default_auto_archive_duration is not UNDEFINED:
-            if not default_auto_archive_duration in (60, 1440, 4320, 10080):
-                raise ValueError("Invalid value given for default_auto_archive_duration " \
-                                "supported values are 60, 1440, 4320 and 10080.")
-
-            json["default_auto_archive_duration"] = default_auto_archive_duration
-
-        if parent is not UNDEFINED:
-            json["parent_id"] = parent.id if parent is not None else None
+        json = _build_text_channel_edit_json(locals())
 
         if json:
-            data = await self._rest.edit_channel(
+            data = await self.guild._rest.edit_channel(
                 channel_id=self.id,
                 json=json,
                 reason=reason
@@ -317,8 +478,7 @@ class CategoryChannel(GuildChannel):
         -------
         List[:class:`GuildChannel`]
         """
-        channels = self.guild.cache.channels()
-        return [channel for channel in channels if channel.parent_id == self.id]
+        return self.guild.cache._get_children_channels(self.id)
 
     async def edit(
         self,
@@ -353,16 +513,10 @@ class CategoryChannel(GuildChannel):
         HTTPException
             Failed to perform this action.
         """
-        json = {}
-
-        if name is not UNDEFINED:
-            json["name"] = name
-
-        if position is not UNDEFINED:
-            json["position"] = position
+        json = _build_category_channel_edit_json(locals())
 
         if json:
-            data = await self._rest.edit_channel(
+            data = await self.guild._rest.edit_channel(
                 channel_id=self.id,
                 json=json,
                 reason=reason
@@ -404,13 +558,12 @@ class VoiceChannel(GuildChannel):
         "video_quality_mode",
     )
 
-    def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
-        super()._update_with_data(data)
-
-        self.bitrate = data.get("bitrate") # type: ignore
-        self.rtc_region = data.get("rtc_region")
-        self.user_limit = data.get("user_limit", 0)
-        self.video_quality_mode = data.get("video_quality_mode", 1)
+    _UPDATE_FIELDS = (
+        ("bitrate", "bitrate", None, None),
+        ("rtc_region", "rtc_region", None, _intern_optional),
+        ("user_limit", "user_limit", 0, None),
+        ("video_quality_mode", "video_quality_mode", 1, None),
+    )
 
     async def edit(
         self,
@@ -466,37 +619,10 @@ class VoiceChannel(GuildChannel):
         HTTPException
             Failed to perform this action.
         """
-        json = {}
-
-        if name is not UNDEFINED:
-            json["name"] = name
-
-        if position is not UNDEFINED:
-            json["position"] = position
-
-        if rtc_region is not UNDEFINED:
-            json["rtc_region"] = rtc_region
-
-        if bitrate is not UNDEFINED:
-            if bitrate < 8000 or bitrate > 128000:
-                raise ValueError("Parameter 'bitrate' must be in range of 8000 and 128000")
-
-            json["bitrate"] = bitrate
-
-        if user_limit is not UNDEFINED:
-            if user_limit is None:
-                user_limit = 0
-
-            json["user_limit"] = user_limit
-
-        if video_quality_mode is not UNDEFINED:
-            json["video_quality_mode"] = video_quality_mode
-
-        if parent is not UNDEFINED:
-            json["parent_id"] = parent.id if parent is not None else None
+        json = _build_voice_channel_edit_json(locals())
 
         if json:
-            data = await self._rest.edit_channel(
+            data = await self.guild._rest.edit_channel(
                 channel_id=self.id,
                 json=json,
                 reason=reason
@@ -535,7 +661,7 @@ class PrivateChannel(BaseModel):
         id: int
         type: int
 
-    __slots__ = ("id", "type", "_client", "_cache", "_rest")
+    __slots__ = ("id", "type", "_client", "_cache", "_rest", "__weakref__")
 
     def __init__(self, data: typing.Dict[str, typing.Any], client: Client) -> None:
         self._client = client
@@ -545,7 +671,7 @@ class PrivateChannel(BaseModel):
 
     def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
         self.id = int(data["id"])
-        self.type = int(data["type"])
+        self.type = to_int(data["type"])
 
 class DMChannel(PrivateChannel, MessagesSupported):
     """Represents a direct message channel between two users.
@@ -601,22 +727,28 @@ def _is_guild_channel(type: int) -> bool:
         ChannelType.STORE,
     )
 
+_GUILD_CHANNEL_TYPES: typing.Dict[int, typing.Type[GuildChannel]] = {
+    ChannelType.TEXT: TextChannel,
+    ChannelType.NEWS: NewsChannel,
+    ChannelType.CATEGORY: CategoryChannel,
+    ChannelType.VOICE: VoiceChannel,
+    ChannelType.STAGE: StageChannel,
+}
+
 def _guild_channel_factory(type: int) -> typing.Type[GuildChannel]:
-    if type is ChannelType.TEXT:
-        return TextChannel
-    if type is ChannelType.NEWS:
-        return NewsChannel
-    if type is ChannelType.CATEGORY:
-        return CategoryChannel
-    if type is ChannelType.VOICE:
-        return VoiceChannel
-    if type is ChannelType.STAGE:
-        return StageChannel
-
-    return GuildChannel
+    return _GUILD_CHANNEL_TYPES.get(type, GuildChannel)
+
+def _create_guild_channels(
+    raw_channels: typing.Iterable[typing.Dict[str, typing.Any]],
+    guild: Guild,
+) -> typing.List[GuildChannel]:
+    # Bulk variant of _guild_channel_factory() used when a large number
+    # of channels are received at once e.g in GUILD_CREATE.
+    get_cls = _GUILD_CHANNEL_TYPES.get
+    return [get_cls(raw["type"], GuildChannel)(raw, guild) for raw in raw_channels]
 
 def _private_channel_factory(type: int) -> typing.Type[PrivateChannel]:
-    if type is ChannelType.DM:
+    if type == ChannelType.DM:
         return DMChannel
 
     return PrivateChannel
@@ -24,15 +24,36 @@ from __future__ import annotations
 
 from qord.models.base import BaseModel
 from qord.models.users import User
-from qord._helpers import parse_iso_timestamp, create_cdn_url, UNDEFINED, BASIC_EXTS
-from datetime import datetime
+from qord._helpers import create_json_builder, parse_iso_timestamp, create_cdn_url, UNDEFINED, BASIC_EXTS
+from datetime import datetime, timezone
+from operator import attrgetter
 
+import copy
 import typing
 
 if typing.TYPE_CHECKING:
     from qord.models.roles import Role
     from qord.models.guilds import Guild
     from qord.flags.users import UserFlags
+    from qord.core.client import Client
+
+
+_get_id = attrgetter("id")
+
+def _role_ids(roles: typing.Optional[typing.List[Role]]) -> typing.List[int]:
+    return list(map(_get_id, roles)) if roles is not None else []
+
+def _isoformat(dt: typing.Optional[datetime]) -> typing.Optional[str]:
+    return dt.isoformat() if dt is not None else None
+
+# (parameter name, JSON key, transformer) entries for GuildMember.edit()
+_build_member_edit_json = create_json_builder((
+    ("nickname", "nick", None),
+    ("roles", "roles", _role_ids),
+    ("mute", "mute", None),
+    ("deaf", "deaf", None),
+    ("timeout_until", "communication_disabled_until", _isoformat),
+))
 
 
 def _user_features(cls):
@@ -123,8 +144,6 @@ class GuildMember(BaseModel):
 
     role_ids: List[:class:`builtins.int`]
         The list of IDs of roles that are associated to this member.
-    roles: List[:class:`Role`]
-        The list of roles associated to this member.
     """
     if typing.TYPE_CHECKING:
         # -- Member properties --
@@ -139,7 +158,6 @@ class GuildMember(BaseModel):
         premium_since: typing.Optional[datetime]
         timeout_until: typing.Optional[datetime]
         role_ids: typing.List[int]
-        roles: typing.List[Role]
 
         # -- User properties (applied by _user_features decorator) --
         id: int
@@ -162,41 +180,98 @@ class GuildMember(BaseModel):
         create_dm = User.create_dm
         send = User.send
 
-    __slots__ = ("guild", "_client", "user", "nickname", "guild_avatar", "deaf", "mute", "pending",
-                "joined_at", "premium_since", "timeout_until", "role_ids", "roles")
+    __slots__ = ("nickname", "guild_avatar", "user", "_guild_avatar_animated", "guild",
+                "role_ids", "_role_id_set", "deaf", "mute", "pending",
+                "joined_at", "premium_since", "timeout_until")
 
     def __init__(self, data: typing.Dict[str, typing.Any], guild: Guild) -> None:
         self.guild = guild
-        self._client = guild._client
         self._update_with_data(data)
 
     def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
-        self.user = User(data["user"], client=self._client)
-        self.nickname = data.get("nick")
-        self.guild_avatar = data.get("avatar")
-        self.deaf = data.get("deaf", False)
-        self.mute = data.get("mute", False)
-        self.pending = data.get("pending", False)
-
-        premium_since = data.get("premium_since")
-        timeout_until = data.get("communication_disabled_until")
+        data_get = data.get
+
+        user_data = data["user"]
+        client = self.guild._client
+        user_id = int(user_data["id"])
+        user = client._cache.get_user(user_id)
+
+        # Users are shared across guilds so reuse the cached instance
+        # instead of creating a new one for every member. The member's user
+        # payload is partial so only the fields present in it are updated.
+        if user is None:
+            user = User(user_data, client=client, user_id=user_id)
+        else:
+            user._update_with_partial_data(user_data)
+
+        self.user = user
+        self.nickname = data_get("nick")
+        self.guild_avatar = guild_avatar = data_get("avatar")
+        self._guild_avatar_animated = guild_avatar is not None and guild_avatar[:2] == "a_"
+        self.deaf = data_get("deaf", False)
+        self.mute = data_get("mute", False)
+        self.pending = data_get("pending", False)
+
+        premium_since = data_get("premium_since")
+        timeout_until = data_get("communication_disabled_until")
 
         self.joined_at = parse_iso_timestamp(data["joined_at"])
         self.premium_since = parse_iso_timestamp(premium_since) if premium_since is not None else None
         self.timeout_until = parse_iso_timestamp(timeout_until) if timeout_until is not None else None
 
-        role_ids = [int(role_id) for role_id in data.get("roles", [])]
-        roles = []
-        guild = self.guild
+        role_ids = list(map(int, data_get("roles", ())))
 
-        for role_id in role_ids:
-            role = guild.cache.get_role(role_id)
+        self.role_ids = role_ids
+        self._role_id_set = frozenset(role_ids)
+        # Resolved lazily by the roles property.
 
-            if role is not None:
-                roles.append(role)
+    @property
+    def _client(self) -> Client:
+        return self.guild._client
 
-        self.role_ids = role_ids
-        self.roles = roles
+    def __copy__(self) -> GuildMember:
+        # Used for the "before" member in GUILD_MEMBER_UPDATE. This avoids
+        # reparsing any data and is faster than __reduce_ex__() based copying.
+        new = object.__new__(self.__class__)
+
+        for slot in self.__slots__:
+            setattr(new, slot, getattr(self, slot))
+
+        # The user is shared with the client cache and updated in place so
+        # the snapshot needs its own copy.
+        new.user = copy.copy(self.user)
+        return new
+
+    @property
+    def roles(self) -> typing.List[Role]:
+        r"""The list of roles associated to this member.
+
+        This builds a new list on every access. When only iterating over the
+        roles, Consider using :meth:`.iter_roles` instead.
+
+        Returns
+        -------
+        List[:class:`Role`]
+        """
+        return list(self.iter_roles())
+
+    def iter_roles(self) -> typing.Iterator[Role]:
+        r"""Returns an iterator over the roles associated to this member.
+
+        Unlike :attr:`.roles`, This does not build a list and resolves
+        the roles from the guild's cache lazily.
+
+        Returns
+        -------
+        Iterator[:class:`Role`]
+        """
+        get_role = self.guild.cache.get_role
+
+        for role_id in self.role_ids:
+            role = get_role(role_id)
+
+            if role is not None:
+                yield role
 
     @property
     def name(self) -> str:
@@ -210,10 +285,8 @@ class GuildMember(BaseModel):
         -------
         :class:`builtins.str`
         """
-        nick = self.nickname
-        if nick is not None:
-            return nick
-        return self.user.name
+        nickname = self.nickname
+        return nickname if nickname is not None else self.user.name
 
     @property
     def avatar(self) -> typing.Optional[str]:
@@ -228,9 +301,7 @@ class GuildMember(BaseModel):
         Optional[:class:`builtins.str`]
         """
         guild_avatar = self.guild_avatar
-        if guild_avatar is not None:
-            return guild_avatar
-        return self.user.avatar
+        return guild_avatar if guild_avatar is not None else self.user.avatar
 
     def avatar_url(self, extension: str = None, size: int = None) -> typing.Optional[str]:
         r"""Returns the avatar URL for this member.
@@ -269,7 +340,7 @@ class GuildMember(BaseModel):
         if avatar is None:
             return self.user.avatar_url(extension=extension, size=size)
         if extension is None:
-            extension = "gif" if self.is_avatar_animated() else "png"
+            extension = "gif" if self._guild_avatar_animated else "png"
 
         return create_cdn_url(
             f"/guilds/{self.guild.id}/users/{self.id}/{self.avatar}",
@@ -290,10 +361,10 @@ class GuildMember(BaseModel):
         -------
         :class:`builtins.bool`
         """
-        avatar = self.avatar
-        if avatar is None:
-            return False
-        return avatar.startswith("a_")
+        if self.guild_avatar is not None:
+            return self._guild_avatar_animated
+
+        return self.user.is_avatar_animated()
 
     def is_boosting(self) -> bool:
         r"""Checks whether the member is boosting the guild.
@@ -314,7 +385,7 @@ class GuildMember(BaseModel):
         timeout_until = self.timeout_until
         if timeout_until is None:
             return False
-        now = datetime.now()
+        now = datetime.now(timezone.utc)
         return now < timeout_until
 
     async def kick(self, *, reason: str = None) -> None:
@@ -381,42 +452,27 @@ class GuildMember(BaseModel):
         HTTPException
             Failed to perform this action.
         """
-        json = {}
-
-        if nickname is not UNDEFINED:
-            json["nick"] = nickname
-
-        if roles is not UNDEFINED:
-            if roles is None:
-                roles = []
-            json["roles"] = [role.id for role in roles]
-
-        if mute is not UNDEFINED:
-            json["mute"] = mute
-
-        if deaf is not UNDEFINED:
-            json["deaf"] = deaf
-
-        if timeout_until is not UNDEFINED:
-            json["communication_disabled_until"] = (
-                timeout_until.isoformat() if timeout_until is not None else None
-            )
+        json = _build_member_edit_json(locals())
 
         if json:
-            guild = self.guild
-            data = await guild._rest.edit_guild_member(
-                guild_id=guild.id,
-                user_id=self.user.id,
-                json=json,
-                reason=reason,
-            )
-            self._update_with_data(data)
+            await self._edit_with_json(json, reason)
+
+    async def _edit_with_json(self, json: typing.Dict[str, typing.Any], reason: typing.Optional[str]) -> None:
+        guild = self.guild
+        data = await guild._rest.edit_guild_member(
+            guild_id=guild.id,
+            user_id=self.user.id,
+            json=json,
+            reason=reason,
+        )
+        self._update_with_data(data)
 
     async def add_roles(
         self,
         *roles: Role,
         overwrite: bool = False,
         ignore_extra: bool = True,
+        atomic: bool = False,
         reason: str = None,
     ) -> typing.List[Role]:
         r"""Adds the provided roles to the members.
@@ -434,6 +490,11 @@ class GuildMember(BaseModel):
         - When ``ignore_extra`` is ``False``, Will always attempt to add the role regardless \
           of whether the role already exists on the member. This would cause unnecessary API calls.
 
+        - When ``atomic`` is ``True`` and more than one role is to be added, The roles are \
+          added in a single API call along with the existing roles of the member. The existing \
+          roles are taken from :attr:`.role_ids` so this relies on the cached roles being up to \
+          date and could remove roles that were added to the member but not cached yet.
+
         - Returns the list of roles that were added to the member.
 
         Parameters
@@ -444,6 +505,8 @@ class GuildMember(BaseModel):
             Whether to overwrite existing roles with new ones.
         ignore_extra: :class:`builtins.bool`
             Whether to ignore extra roles that already exist on members. Defaults to ``True``.
+        atomic: :class:`builtins.bool`
+            Whether to add the roles in a single API call. Defaults to ``False``.
         reason: :class:`builtins.str`
             The reason for performing this action.
 
@@ -458,32 +521,30 @@ class GuildMember(BaseModel):
             await self.edit(roles=roles, reason=reason) # type: ignore
             return self.roles
 
-        ret: typing.List[Role] = []
-        existing_roles = self.role_ids
+        if ignore_extra:
+            # Roles that already exist (or are passed more than once) are ignored.
+            to_add = {role.id: role for role in roles if role.id not in self._role_id_set}
+            ret = list(to_add.values())
 
-        rest = self.guild._rest
-        guild_id = self.guild.id
-        user_id = self.user.id
+            if not ret:
+                return ret
+        else:
+            ret = list(roles)
 
-        for role in roles:
-            if role.id in existing_roles and ignore_extra:
-                # Role already exists, ignore.
-                continue
-
-            await rest.add_guild_member_role(
-                guild_id=guild_id,
-                user_id=user_id,
-                role_id=role.id,
-                reason=reason,
-            )
-            ret.append(role)
+        if atomic and len(ret) > 1:
+            # Add all roles in a single request instead of one request per role.
+            role_ids = list(dict.fromkeys(self.role_ids + list(map(_get_id, ret))))
+            await self._edit_with_json({"roles": role_ids}, reason)
+            return ret
 
+        await self._perform_role_requests(self.guild._rest.add_guild_member_role, ret, reason)
         return ret
 
     async def remove_roles(
         self,
         *roles: Role,
         ignore_extra: bool = True,
+        atomic: bool = False,
         reason: str = None,
     ) -> typing.List[Role]:
         r"""Removes the provided roles from the members.
@@ -501,6 +562,11 @@ class GuildMember(BaseModel):
           regardless of whether the role is already not on the member. This would cause
           unnecessary API calls.
 
+        - When ``atomic`` is ``True`` and more than one role is to be removed, The roles are \
+          removed in a single API call. The remaining roles are taken from :attr:`.role_ids` \
+          so this relies on the cached roles being up to date and could remove roles that were \
+          added to the member but not cached yet.
+
         - Returns the list of roles that were removed to the member.
 
         Parameters
@@ -510,6 +576,8 @@ class GuildMember(BaseModel):
         ignore_extra: :class:`builtins.bool`
             Whether to ignore extra roles that are already not on member. Defaults
             to ``True``.
+        atomic: :class:`builtins.bool`
+            Whether to remove the roles in a single API call. Defaults to ``False``.
         reason: :class:`builtins.str`
             The reason for performing this action.
 
@@ -524,24 +592,36 @@ class GuildMember(BaseModel):
             await self.edit(roles=[], reason=reason) # type: ignore
             return self.roles
 
-        ret: typing.List[Role] = []
-        existing_roles = self.role_ids
+        if ignore_extra:
+            # Roles that are already removed (or are passed more than once) are ignored.
+            to_remove = {role.id: role for role in roles if role.id in self._role_id_set}
+            ret = list(to_remove.values())
+
+            if not ret:
+                return ret
+        else:
+            ret = list(roles)
 
-        rest = self.guild._rest
+        if atomic and len(ret) > 1:
+            # Remove all roles in a single request instead of one request per role.
+            removed_ids = set(map(_get_id, ret))
+            role_ids = [role_id for role_id in self.role_ids if role_id not in removed_ids]
+            await self._edit_with_json({"roles": role_ids}, reason)
+            return ret
+
+        await self._perform_role_requests(self.guild._rest.remove_guild_member_role, ret, reason)
+        return ret
+
+    async def _perform_role_requests(
+        self,
+        request: typing.Callable[..., typing.Awaitable[typing.Any]],
+        roles: typing.List[Role],
+        reason: typing.Optional[str],
+    ) -> None:
+        # The requests share the same ratelimit bucket and the REST client
+        # does not handle ratelimits yet so they are performed one by one.
         guild_id = self.guild.id
         user_id = self.user.id
 
         for role in roles:
-            if role.id not in existing_roles and ignore_extra:
-                # Role already removed, ignore.
-                continue
-
-            await rest.remove_guild_member_role(
-                guild_id=guild_id,
-                user_id=user_id,
-                role_id=role.id,
-                reason=reason,
-            )
-            ret.append(role)
-
-        return ret
+            await request(guild_id=guild_id, user_id=user_id, role_id=role.id, reason=reason)
@@ -26,7 +26,7 @@ from qord.core.cache import GuildCache
 from qord.models.base import BaseModel
 from qord.models.roles import Role
 from qord.models.guild_members import GuildMember
-from qord.models.channels import _guild_channel_factory, GuildChannel
+from qord.models.channels import _guild_channel_factory, _create_guild_channels, GuildChannel
 from qord.flags.system_channel import SystemChannelFlags
 from qord.enums import ChannelType
 from qord._helpers import (
@@ -231,21 +231,21 @@ class Guild(BaseModel):
         self.member_count = data.get("member_count")
 
         cache = self._cache
-        client_cache = self._client_cache
+        add_role = cache.add_role
+        add_member = cache.add_member
+        add_channel = cache.add_channel
+        add_user = self._client_cache.add_user
 
-        for raw_role in data.get("roles", []):
-            role = Role(raw_role, guild=self)
-            cache.add_role(role)
+        for raw_role in data.get("roles", ()):
+            add_role(Role(raw_role, guild=self))
 
-        for raw_member in data.get("members", []):
+        for raw_member in data.get("members", ()):
             member = GuildMember(raw_member, guild=self)
-            cache.add_member(member)
-            client_cache.add_user(member.user)
+            add_member(member)
+            add_user(member.user)
 
-        for raw_channel in data.get("channels", []):
-            cls = _guild_channel_factory(raw_channel["type"])
-            channel = cls(raw_channel, guild=self)
-            cache.add_channel(channel)
+        for channel in _create_guild_channels(data.get("channels", ()), self):
+            add_channel(channel)
 
     def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
         # I'm documenting these attributes here for future reference when we
@@ -541,7 +541,7 @@ class Guild(BaseModel):
         if self.icon is None:
             return False
 
-        return self.icon.startswith("a_")
+        return self.icon[:2] == "a_"
 
     # API calls
 
@@ -710,13 +710,7 @@ class Guild(BaseModel):
             Failed to fetch the channels.
         """
         data = await self._rest.get_guild_channels(guild_id=self.id)
-        ret = []
-
-        for channel in data:
-            cls = _guild_channel_factory(channel["type"])
-            ret.append(cls(channel, guild=self)) # should always be a subclass of GuildChannel
-
-        return ret
+        return _create_guild_channels(data, self)
 
     async def create_channel(
         self,
@@ -89,15 +89,17 @@ class User(BaseModel):
                 "accent_color", "premium_type", "system",  "locale", "avatar", "banner", "flags",
                 "public_flags", "__weakref__")
 
-    def __init__(self, data: typing.Dict[str, typing.Any], client: Client) -> None:
+    def __init__(self, data: typing.Dict[str, typing.Any], client: Client, user_id: int = None) -> None:
         self._client = client
         self._rest = client._rest
         self._cache = client._cache
         self._dm = None
+        # The ID never changes so it is only set here. Callers that have
+        # already parsed it (e.g. for a cache lookup) can pass it directly.
+        self.id = int(data["id"]) if user_id is None else user_id
         self._update_with_data(data)
 
     def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
-        self.id = int(data["id"])
         self.name = data["username"]
         self.discriminator = data["discriminator"]
         self.bot = data.get("bot", False)
@@ -110,6 +112,33 @@ class User(BaseModel):
         self.avatar = data.get("avatar")
         self.banner = data.get("banner")
 
+    def _update_with_partial_data(self, data: typing.Dict[str, typing.Any]) -> None:
+        # Used for user objects embedded in other payloads (e.g. guild members)
+        # which may not include every field. Unlike _update_with_data(), the
+        # fields missing from the payload are left as-is.
+        if "username" in data:
+            self.name = data["username"]
+        if "discriminator" in data:
+            self.discriminator = data["discriminator"]
+        if "bot" in data:
+            self.bot = data["bot"]
+        if "flags" in data:
+            self.flags = UserFlags(data["flags"])
+        if "public_flags" in data:
+            self.public_flags = UserFlags(data["public_flags"])
+        if "accent_color" in data:
+            self.accent_color = data["accent_color"]
+        if "premium_type" in data:
+            self.premium_type = data["premium_type"]
+        if "system" in data:
+            self.system = data["system"]
+        if "locale" in data:
+            self.locale = data["locale"]
+        if "avatar" in data:
+            self.avatar = data["avatar"]
+        if "banner" in data:
+            self.banner = data["banner"]
+
     @property
     def default_avatar(self) -> int:
         """Returns the default avatar index for this user.
@@ -271,7 +300,7 @@ class User(BaseModel):
         if self.avatar is None:
             return False
 
-        return self.avatar.startswith("a_")
+        return self.avatar[:2] == "a_"
 
     def is_banner_animated(self) -> bool:
         """Indicates whether the user has animated banner.
@@ -285,7 +314,7 @@ class User(BaseModel):
         if self.banner is None:
             return False
 
-        return self.banner.startswith("a_")
+        return self.banner[:2] == "a_"
 
     async def create_dm(self, *, force: bool = False) -> DMChannel:
         """Creates or gets the direct message channel associated to this user.
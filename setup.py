@@ -1,4 +1,4 @@
-from setuptools import setup
+from setuptools import setup, find_namespace_packages
 
 with open("README.MD", "r", encoding="utf-8") as f:
     LONG_DESCRIPTION = f.read()
@@ -14,13 +14,9 @@ with open("requirements.txt", "r") as f:
     while "\n" in REQUIREMENTS:
         REQUIREMENTS.remove("\n")
 
-PACKAGES = [
-    "qord",
-    "qord.core",
-    "qord.events",
-    "qord.flags",
-    "qord.models",
-]
+# qord.core, qord.flags and qord.models have no __init__.py so
+# find_packages() would skip them.
+PACKAGES = find_namespace_packages(include=["qord", "qord.*"], exclude=["*.__pycache__"])
 
 setup(
     name="qord",
@@ -37,7 +33,11 @@ setup(
     long_description_content_type="text/markdown",
     include_package_data=True,
     install_requires=REQUIREMENTS,
+    extras_require={
+        "fast": ["ciso8601>=2.3"],
+    },
     packages=PACKAGES,
+    zip_safe=False,
     python_requires='>=3.8.0',
     classifiers=[
         'Development Status :: 3 - Alpha',